@@ -1,79 +1,307 @@
-import pandas as pd
+# pandas/NumPy are imported inside the methods that use them, so the menu comes up
+# without paying their import cost; the roster is loaded on the first data action.
+import bisect
 import os
+import warnings
+from collections import Counter
 
 # --- Configuration ---
-FILE_NAME = 'students.xlsx'
+FILE_NAME = 'students.parquet'
+EXCEL_FILE_NAME = 'students.xlsx'
 SHEET_NAME = 'Roster'
 COLUMNS = ['roll_no', 'name', 'marks']
+# Marks are 0-100 and roll numbers are limited to the int32 range, so both can be stored narrowly;
+# marks are nullable so rosters with blank marks load without losing those rows
+DTYPES = {'roll_no': 'int32', 'name': 'string[pyarrow]', 'marks': 'Int8'}
+ROLL_NO_MIN, ROLL_NO_MAX = -2**31, 2**31 - 1
+# Parquet metadata key holding the mtime/size of the workbook an Excel load cache was built from
+CACHE_SIGNATURE_KEY = b'workbook_signature'
+# Lower edge of each class band above 'Fail'; marks >= 75 are a Distinction
+CLASS_BINS = (35, 50, 60, 75)
+CLASS_LABELS = ('Fail', 'Third Class', 'Second Class', 'First Class', 'Distinction')
 # ---------------------
 
+_lxml_warning_shown = False  # the missing-lxml note is printed once per session
+
+
+class RosterFileError(Exception):
+    """Raised when a roster file holds values that cannot be stored without changing them."""
+
 class StudentManager:
     """
-    Manages student data, reading from and writing to an Excel file 
-    using pandas. Encapsulates all CRUD and reporting logic.
+    Manages student data, stored as a Parquet file using pandas, with
+    on-demand export to Excel. Encapsulates all CRUD and reporting logic.
     """
-    def __init__(self, file_name, sheet_name):
-        """Initializes the manager, loads data, and sets configurations."""
+    def __init__(self, file_name, sheet_name, excel_file_name=EXCEL_FILE_NAME):
+        """Initializes the manager and sets configurations; data is loaded on first use."""
         self.file_name = file_name
         self.sheet_name = sheet_name
-        self.students_df = self._load_data()
+        # An .xlsx store keeps the old Excel-as-database behaviour
+        self.excel_file_name = file_name if self._is_excel_store() else excel_file_name
+        self.cache_file_name = self.excel_file_name + '.cache.parquet'
+        self.students_df = None  # loaded by _ensure_loaded()
 
     # --- Utility/Private Methods ---
 
+    def _ensure_loaded(self):
+        """Loads the roster and builds its lookup structures the first time they are needed."""
+        if self.students_df is not None:
+            return
+        self.students_df = self._load_data()
+        # Deletes leave gaps in the index labels, so new rows draw fresh labels from a counter
+        self._next_label = int(self.students_df.index.max()) + 1 if len(self.students_df) else 0
+        self._rebuild_roll_index()
+        self._rebuild_stats()
+
+    def _rebuild_roll_index(self):
+        """Maps each roll number to the DataFrame index labels of its rows for O(1) lookups."""
+        self._roll_index = {}
+        self._index_rows(self.students_df)
+
+    def _index_rows(self, df):
+        """Adds the rows of df to _roll_index."""
+        # Roll numbers are not guaranteed unique (every blank roll loads as -1), so each
+        # key keeps all of its labels and search/update/delete act on every matching row
+        for roll_no, label in zip(df['roll_no'].tolist(), df.index):
+            self._roll_index.setdefault(roll_no, []).append(label)
+
+    def _rebuild_stats(self):
+        """Recomputes the running mark totals that generate_report reads."""
+        marks = self.students_df['marks']
+        self._marks_sum = int(marks.sum())  # blank marks are skipped, as mean() skips them
+        self._marks_counts = Counter(marks.dropna().tolist())  # mark -> number of students; at most 101 keys
+        self._class_counts = Counter(self._class_labels(marks))
+
+    def _track_marks(self, mark, delta):
+        """Adds (delta=1) or removes (delta=-1) one student's mark from the running totals."""
+        import pandas as pd
+
+        if pd.isna(mark):
+            # A blank mark only counts towards the 'Fail' class, matching _class_labels
+            self._class_counts[CLASS_LABELS[0]] += delta
+            return
+        mark = int(mark)
+        self._marks_sum += delta * mark
+        self._marks_counts[mark] += delta
+        if not self._marks_counts[mark]:
+            del self._marks_counts[mark]
+        self._class_counts[CLASS_LABELS[bisect.bisect_right(CLASS_BINS, mark)]] += delta
+
+    def _append_rows(self, new_rows):
+        """Concatenates already validated new rows into the DataFrame and its lookup structures."""
+        import pandas as pd
+
+        new_rows = new_rows.astype(DTYPES)
+        new_rows.index = range(self._next_label, self._next_label + len(new_rows))
+        self._next_label += len(new_rows)
+        # Stable sort is near-linear on an already sorted frame with rows appended at the end;
+        # labels move with their rows, so _roll_index stays valid
+        self.students_df = pd.concat([self.students_df, new_rows]).sort_values('roll_no', kind='stable')
+        self._index_rows(new_rows)
+        for mark in new_rows['marks'].tolist():
+            self._track_marks(mark, 1)
+
+    def _is_excel_store(self):
+        """Returns True when the roster itself is kept in an Excel file."""
+        return self.file_name.endswith('.xlsx')
+
     def _load_data(self):
-        """Loads student data from the Excel file."""
-        if os.path.exists(self.file_name):
-            try:
-                df = pd.read_excel(self.file_name, sheet_name=self.sheet_name)
-                df['roll_no'] = df['roll_no'].fillna(-1).astype(int)
-                return df
-            except Exception as e:
-                print(f" Error reading file {self.file_name}: {e}. Starting with an empty roster.")
+        """Loads student data from the Parquet file, migrating from Excel if needed."""
+        import pandas as pd
+
+        source = self.file_name
+        try:
+            if not self._is_excel_store() and os.path.exists(self.file_name):
+                df = pd.read_parquet(self.file_name)
+            elif os.path.exists(self.excel_file_name):
+                source = self.excel_file_name
+                # Excel-backed store, or a roster saved before the switch to Parquet
+                df = self._read_excel()
+            else:
+                df = None
+
+            if df is not None:
+                roll_no = pd.to_numeric(df['roll_no'], errors='coerce')
+                marks = pd.to_numeric(df['marks'], errors='coerce')
+                # Blank roll numbers become -1 and blank marks stay <NA>, as before. Anything else
+                # that would wrap, truncate or fail in the int32/Int8 cast stops the load instead
+                # of being changed or dropped, which the next save would make permanent.
+                unparsable = (roll_no.isna() & df['roll_no'].notna()) | (marks.isna() & df['marks'].notna())
+                roll_no = roll_no.fillna(-1)
+                invalid = unparsable | ~self._valid_records(roll_no, marks.fillna(0))
+                if invalid.any():
+                    rows = ', '.join(str(position + 1) for position in invalid.to_numpy().nonzero()[0][:5])
+                    raise RosterFileError(
+                        f"{source} has {int(invalid.sum())} row(s) that cannot be loaded without changing them "
+                        f"(data row {rows}{', ...' if invalid.sum() > 5 else ''}). Roll numbers must be whole numbers "
+                        f"in {ROLL_NO_MIN}..{ROLL_NO_MAX} and marks whole numbers in 0-100 (or blank). "
+                        "Fix the file and restart; it has not been modified.")
+                df = df.assign(roll_no=roll_no, marks=marks)
+                # The roster is kept sorted by roll number so views never need to sort
+                return df.astype(DTYPES).sort_values('roll_no', kind='stable', ignore_index=True)
+        except RosterFileError:
+            raise
+        except Exception as e:
+            print(f" Error reading file {source}: {e}. Starting with an empty roster.")
 
         # Create a new empty DataFrame if loading failed or file doesn't exist
-        return pd.DataFrame(columns=COLUMNS)
+        return pd.DataFrame(columns=COLUMNS).astype(DTYPES)
+
+    def _valid_records(self, roll_no, marks):
+        """Returns a mask of rows whose roll number fits int32 and whose marks are whole numbers in 0-100."""
+        return (roll_no.between(ROLL_NO_MIN, ROLL_NO_MAX) & (roll_no % 1 == 0)
+                & marks.between(0, 100) & (marks % 1 == 0))
+
+    def _read_excel(self):
+        """Reads the roster sheet with a streaming parser instead of a full XML DOM."""
+        import pandas as pd
+
+        # The cache is only used for the exact workbook it was written from. Parquet is used rather
+        # than pickle so a cache file found next to a shared workbook cannot run code when loaded.
+        if os.path.exists(self.cache_file_name):
+            import pyarrow.parquet as pq
+
+            try:
+                metadata = pq.read_schema(self.cache_file_name).metadata or {}
+            except Exception:
+                metadata = {}  # unreadable cache: fall back to parsing the workbook
+            if metadata.get(CACHE_SIGNATURE_KEY) == self._workbook_signature():
+                return pd.read_parquet(self.cache_file_name)
+
+        try:
+            return pd.read_excel(self.excel_file_name, sheet_name=self.sheet_name, engine='calamine')
+        except ImportError:
+            # python-calamine not installed: use openpyxl's read-only mode
+            return pd.read_excel(self.excel_file_name, sheet_name=self.sheet_name, engine='openpyxl',
+                                 engine_kwargs={'read_only': True, 'data_only': True})
+
+    def _workbook_signature(self):
+        """Identifies the current workbook contents by exact mtime (ns) and size."""
+        stat = os.stat(self.excel_file_name)
+        return f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+    def _write_excel_cache(self):
+        """Saves the roster as Parquet next to the workbook, tagged with the workbook's signature."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(self.students_df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), CACHE_SIGNATURE_KEY: self._workbook_signature()}
+        pq.write_table(table.replace_schema_metadata(metadata), self.cache_file_name, compression='zstd')
 
     def _save_data(self):
-        """Saves the current DataFrame back to the Excel file."""
+        """Saves the current DataFrame back to the roster file."""
         try:
-            with pd.ExcelWriter(self.file_name, engine='xlsxwriter') as writer:
-                self.students_df.to_excel(writer, sheet_name=self.sheet_name, index=False)
+            if self._is_excel_store():
+                self._write_excel()
+            else:
+                self.students_df.to_parquet(self.file_name, engine='pyarrow', compression='zstd', index=False)
             print(f"Data saved successfully to {self.file_name}.")
         except Exception as e:
-            print(f" Error saving data to Excel: {e}")
+            print(f" Error saving data to {self.file_name}: {e}")
+
+    def _write_excel(self):
+        """Writes the current DataFrame to the Excel file and refreshes its load cache."""
+        try:
+            self._write_excel_streaming()
+        except ImportError:
+            # openpyxl not available: fall back to xlsxwriter
+            self._write_excel_constant_memory()
+        self._write_excel_cache()
+
+    def _write_excel_constant_memory(self):
+        """Writes rows in order with xlsxwriter's constant_memory mode, flushing each row as it goes."""
+        import xlsxwriter
+
+        # constant_memory only keeps the current row, so rows are written strictly top to bottom
+        # here rather than through DataFrame.to_excel, which does not write in row order
+        options = {'constant_memory': True, 'strings_to_numbers': False}
+        with xlsxwriter.Workbook(self.excel_file_name, options) as wb:
+            ws = wb.add_worksheet(self.sheet_name)
+            ws.write_row(0, 0, self.students_df.columns)
+            for row_num, row in enumerate(self._excel_rows(), start=1):
+                ws.write_row(row_num, 0, row)
+
+    def _write_excel_streaming(self):
+        """Streams rows into a write-only openpyxl workbook (no in-memory cell tree)."""
+        global _lxml_warning_shown
+        from openpyxl import Workbook
+        try:
+            import lxml  # noqa: F401 -- openpyxl uses it for fast streaming writes
+        except ImportError:
+            if not _lxml_warning_shown:
+                _lxml_warning_shown = True
+                warnings.warn("lxml is not installed; write-only Excel saves will be slower.", RuntimeWarning)
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(self.sheet_name)
+        ws.append(list(self.students_df.columns))
+        for row in self._excel_rows():
+            ws.append(row)
+        wb.save(self.excel_file_name)
+
+    def _excel_rows(self):
+        """Yields the roster rows for the Excel writers, with missing values as empty cells."""
+        import pandas as pd
+
+        for row in self.students_df.itertuples(index=False, name=None):
+            yield tuple(None if pd.isna(value) else value for value in row)
 
     def _get_integer_input(self, prompt, min_val=None, max_val=None):
         """Handles integer input validation."""
         while True:
-            try:
-                value = int(input(prompt))
-                if min_val is not None and value < min_val:
-                    print(f" Value must be at least {min_val}.")
-                    continue
-                if max_val is not None and value > max_val:
-                    print(f" Value cannot exceed {max_val}.")
-                    continue
-                return value
-            except ValueError:
+            text = input(prompt).strip()
+            # Validate up front instead of letting int() raise; isdecimal() only accepts
+            # characters int() can parse, and rejects a doubled sign such as '--5'
+            digits = text[1:] if text[:1] in ('+', '-') else text
+            if not digits.isdecimal():
                 print(" Invalid input. Please enter a whole number.")
-
-    def _apply_class_label(self, df):
-        """Adds a 'class' column to a DataFrame copy based on marks."""
-        if df.empty:
-            return df
-            
-        bins = [0, 35, 50, 60, 75, 101] 
-        labels = ['Fail', 'Third Class', 'Second Class', 'First Class', 'Distinction']
-        
-        df['class'] = pd.cut(df['marks'], bins=bins, labels=labels, right=False)
-        df['class'] = df['class'].astype(str).replace('nan', 'Fail')
-        
-        return df
+                continue
+
+            value = int(text)
+            if min_val is not None and value < min_val:
+                print(f" Value must be at least {min_val}.")
+                continue
+            if max_val is not None and value > max_val:
+                print(f" Value cannot exceed {max_val}.")
+                continue
+            return value
+
+    def _class_labels(self, marks):
+        """Returns the class label for each of the given marks as a Categorical."""
+        import numpy as np
+        import pandas as pd
+
+        # Blank marks are classed as 'Fail', as the original pd.cut labelling did
+        codes = np.searchsorted(CLASS_BINS, marks.to_numpy(dtype=np.int8, na_value=0), side='right')
+        return pd.Categorical.from_codes(codes, CLASS_LABELS)
+
+    def _with_class(self, df):
+        """Returns df with a 'class' column; with pandas 3's Copy-on-Write the other columns are not copied."""
+        return df.assign(**{'class': self._class_labels(df['marks'])})
+
+    def _roster_lines(self, df):
+        """Yields the roster table one formatted line at a time instead of building one big string."""
+        import pandas as pd
+
+        roll_nos = df['roll_no']
+        # Rows are sorted by roll number, so the widest roll number is the first or the last one
+        roll_width = max(len('roll_no'), len(str(roll_nos.iat[0])), len(str(roll_nos.iat[-1])))
+        # Missing names print as '<NA>', which is no wider than the header; max() is NA if all are missing
+        longest_name = df['name'].str.len().max()
+        name_width = len('name') if pd.isna(longest_name) else max(len('name'), int(longest_name))
+
+        yield f"{'roll_no':>{roll_width}} {'name':<{name_width}} {'marks':>5} class"
+        for roll_no, name, marks, label in df.itertuples(index=False, name=None):
+            yield f"{roll_no:>{roll_width}} {name:<{name_width}} {marks:>5} {label}"
 
     # --- Public CRUD & Reporting Methods ---
 
     def add_student(self):
         """Adds a new student record to the DataFrame with validation."""
+        import pandas as pd
+
+        self._ensure_loaded()
         print("\n--- Add New Student ---")
         name = input("Enter student name: ").strip()
         if not name:
@@ -81,42 +309,82 @@ class StudentManager:
             return
 
         while True:
-            roll_no = self._get_integer_input("Enter roll number: ")
-            if roll_no in self.students_df['roll_no'].values:
+            roll_no = self._get_integer_input("Enter roll number: ", min_val=ROLL_NO_MIN, max_val=ROLL_NO_MAX)
+            if roll_no in self._roll_index:
                 print(f" Error: Roll number {roll_no} already exists.")
             else:
                 break
 
         marks = self._get_integer_input("Enter marks (0-100): ", min_val=0, max_val=100)
 
-        new_row = pd.DataFrame([{'roll_no': roll_no, 'name': name, 'marks': marks}])
-        self.students_df = pd.concat([self.students_df, new_row], ignore_index=True)
+        self._append_rows(pd.DataFrame([{'roll_no': roll_no, 'name': name, 'marks': marks}]))
         
         self._save_data()
         print(" Student added successfully.")
 
+    def bulk_add_students(self):
+        """Adds many student records from a CSV file, validating them together and saving once."""
+        import pandas as pd
+
+        self._ensure_loaded()
+        print("\n--- Bulk Add Students ---")
+        path = input("Enter CSV file path (columns: roll_no, name, marks): ").strip()
+        try:
+            new_df = pd.read_csv(path, usecols=COLUMNS, dtype={'name': 'string[pyarrow]'})
+        except Exception as e:
+            print(f" Error reading CSV file {path}: {e}")
+            return
+
+        roll_no = pd.to_numeric(new_df['roll_no'], errors='coerce')
+        marks = pd.to_numeric(new_df['marks'], errors='coerce')
+        name = new_df['name'].str.strip()
+
+        # Same rules as add_student, checked for every row at once
+        valid = (name.fillna('').ne('')
+                 & self._valid_records(roll_no, marks)
+                 & ~roll_no.isin(self.students_df['roll_no']))
+        # Repeats within the file are judged among valid rows only, so an invalid first
+        # occurrence does not also knock out a later valid row with the same roll number
+        valid &= ~roll_no.where(valid).duplicated()
+        skipped = len(new_df) - int(valid.sum())
+
+        if not valid.any():
+            print(f" No valid new student records found in {path}.")
+            return
+
+        added = pd.DataFrame({'roll_no': roll_no[valid], 'name': name[valid], 'marks': marks[valid]})
+        self._append_rows(added)
+
+        self._save_data()
+        print(f" {len(added)} student(s) added successfully.")
+        if skipped:
+            print(f" Skipped {skipped} row(s) with missing/invalid values or duplicate roll numbers.")
+
     def view_students(self):
         """Prints all student records from the DataFrame."""
+        self._ensure_loaded()
         if self.students_df.empty:
             print("The student roster is currently empty.")
             return
         
-        display_df = self._apply_class_label(self.students_df.copy()) 
-        display_df = display_df.sort_values(by='roll_no').reset_index(drop=True)
+        display_df = self._with_class(self.students_df)
         
         print("\n--- Student Roster ---")
-        print(display_df.to_string(index=False))
+        for line in self._roster_lines(display_df):
+            print(line)
         print("----------------------")
 
 
     def search_student(self):
         """Searches for a student by roll number."""
+        self._ensure_loaded()
         roll_no = self._get_integer_input("Enter roll number to search: ")
         
-        result = self.students_df[self.students_df['roll_no'] == roll_no]
+        labels = self._roll_index.get(roll_no)
         
-        if not result.empty:
-            result_with_class = self._apply_class_label(result.copy())
+        if labels is not None:
+            result = self.students_df.loc[labels]
+            result_with_class = self._with_class(result)
             print(f"\n Student Found (Roll No: {roll_no}):")
             print(result_with_class.to_string(index=False, header=True))
         else:
@@ -124,11 +392,12 @@ class StudentManager:
 
     def update_student(self):
         """Updates the name or marks for an existing student."""
+        self._ensure_loaded()
         roll_no = self._get_integer_input("Enter roll number of student to update: ")
         
-        index_to_update = self.students_df[self.students_df['roll_no'] == roll_no].index
+        index_to_update = self._roll_index.get(roll_no)  # labels of every row with this roll number
         
-        if index_to_update.empty:
+        if index_to_update is None:
             print(f" Student with roll number {roll_no} not found.")
             return
 
@@ -149,6 +418,9 @@ class StudentManager:
                 return
         elif choice == '2':
             new_marks = self._get_integer_input("Enter new marks (0-100): ", min_val=0, max_val=100)
+            for old_marks in self.students_df.loc[index_to_update, 'marks'].tolist():
+                self._track_marks(old_marks, -1)
+                self._track_marks(new_marks, 1)
             self.students_df.loc[index_to_update, 'marks'] = new_marks
             print(" Marks updated.")
         else:
@@ -159,55 +431,94 @@ class StudentManager:
 
     def delete_student(self):
         """Deletes a student record by roll number."""
+        self._ensure_loaded()
         roll_no_to_delete = self._get_integer_input("Enter roll number to delete: ")
         
-        if roll_no_to_delete not in self.students_df['roll_no'].values:
+        if roll_no_to_delete not in self._roll_index:
             print(f"Student with roll number {roll_no_to_delete} not found.")
             return
 
-        self.students_df = self.students_df[self.students_df['roll_no'] != roll_no_to_delete]
+        # Dropping by label leaves the other labels (and their _roll_index entries) untouched
+        labels = self._roll_index.pop(roll_no_to_delete)
+        for marks in self.students_df.loc[labels, 'marks'].tolist():
+            self._track_marks(marks, -1)
+        self.students_df = self.students_df.drop(index=labels)
         
         self._save_data()
         print(f" Student with roll number {roll_no_to_delete} deleted.")
 
     def generate_report(self):
         """Calculates, classifies, and displays basic statistics on student marks."""
+        import numpy as np
+        import pandas as pd
+
+        self._ensure_loaded()
         if self.students_df.empty:
             print("Cannot generate report: The student roster is empty.")
             return
 
-        # Use the utility to classify the data for the report
-        report_df = self._apply_class_label(self.students_df.copy()) 
-        
-        marks = report_df['marks']
+        # Statistics come from the running totals kept up to date by every mutation
+        total_students = len(self.students_df)
+        marked_students = sum(self._marks_counts.values())  # students whose marks are not blank
+        highest_mark = max(self._marks_counts, default=None)
         
         print("\n--- Student Performance Report ---")
         
         # General Statistics
-        print(f"Total Students: {len(report_df)}")
-        print(f"Average Marks: {marks.mean():.2f}")
-        print(f"Highest Marks: {marks.max()}")
-        print(f"Lowest Marks: {marks.min()}")
+        print(f"Total Students: {total_students}")
+        if marked_students:
+            print(f"Average Marks: {self._marks_sum / marked_students:.2f}")
+            print(f"Highest Marks: {highest_mark}")
+            print(f"Lowest Marks: {min(self._marks_counts)}")
+        else:
+            print("Average/Highest/Lowest Marks: n/a (no marks recorded)")
 
         # Classification Summary
         print("\n--- Class Summary ---")
-        class_counts = report_df['class'].value_counts().sort_index()
+        class_counts = pd.Series([self._class_counts[label] for label in CLASS_LABELS],
+                                 index=pd.Index(CLASS_LABELS, name='class'))
         print(class_counts.to_string())
 
         # Top Performer(s)
-        if not marks.empty:
-            highest_mark = marks.max()
-            top_students = report_df[report_df['marks'] == highest_mark]
+        if marked_students:
+            # highest_mark is already known, so one NumPy compare over the column finds the rows
+            top_rows = np.flatnonzero(self.students_df['marks'].to_numpy(dtype=np.int8, na_value=-1) == highest_mark)
+            top_students = self._with_class(self.students_df.iloc[top_rows])
             print("\nTop Performer(s):")
             print(top_students[['roll_no', 'name', 'marks', 'class']].to_string(index=False))
         
         print("----------------------------------")
 
+    def export_xlsx(self):
+        """Exports the current roster to the Excel file for sharing."""
+        self._ensure_loaded()
+        if self.students_df.empty:
+            print("Nothing to export: The student roster is empty.")
+            return
+
+        try:
+            self._write_excel()
+            print(f"Roster exported successfully to {self.excel_file_name}.")
+        except Exception as e:
+            print(f" Error exporting data to Excel: {e}")
+
 # ------------------- Main Menu Logic (Stays Outside the Class) -------------------
 
 def menu(manager):
     """Main application loop, interacting with the StudentManager object."""
     print("Welcome to the Student Management System!")
+    # Menu choice -> action; None marks the exit entry
+    actions = {
+        '1': manager.add_student,
+        '2': manager.view_students,
+        '3': manager.search_student,
+        '4': manager.update_student,
+        '5': manager.delete_student,
+        '6': manager.generate_report,
+        '7': manager.export_xlsx,
+        '8': manager.bulk_add_students,
+        '9': None,
+    }
     while True:
         print("\n--- Menu ---")
         print("1. Add Student (Create)")
@@ -216,33 +527,30 @@ def menu(manager):
         print("4. Update Student")
         print("5. Delete Student")
         print("6. Generate Report")
-        print("7. Exit")
+        print("7. Export to Excel")
+        print("8. Bulk Add Students (CSV)")
+        print("9. Exit")
         choice = input("Enter your choice: ")
         
-        if choice == '1':
-            manager.add_student()
-        elif choice == '2':
-            manager.view_students()
-        elif choice == '3':
-            manager.search_student()
-        elif choice == '4':
-            manager.update_student()
-        elif choice == '5':
-            manager.delete_student()
-        elif choice == '6':
-            manager.generate_report()
-        elif choice == '7':
+        if choice not in actions:
+            print("Invalid choice. Please select a number from the menu.")
+            continue
+
+        action = actions[choice]
+        if action is None:
             print("Exiting application. Goodbye! ")
             break
-        else:
-            print("Invalid choice. Please select a number from the menu.")
+        action()
 
 # --- Execution ---
 if __name__ == "__main__":
-    # Create the manager object once. This calls the __init__ and loads the data.
+    # Create the manager object once. The roster itself is loaded on the first data action.
     student_manager = StudentManager(FILE_NAME, SHEET_NAME)
     
     # Start the application menu, passing the object
 
-    menu(student_manager)
+    try:
+        menu(student_manager)
+    except RosterFileError as e:
+        print(f" Error: {e}")
 